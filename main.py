@@ -3,9 +3,13 @@ matplotlib.use('Agg')  # Use Agg backend to avoid GUI issues
 
 import os
 import json
-import pandas as pd
+import logging
 from pathlib import Path
 import sys
+try:
+    import orjson  # Faster C-backed JSON encoder, used when available
+except ImportError:
+    orjson = None
 from ring_analysis import analyze_system
 from plotting import plot_puckering_distribution
 
@@ -35,7 +39,7 @@ def print_summary(results):
 
 
 def save_results(results, output_dir):
-    """Save results to JSON file in the specified output directory"""
+    """Save results to JSON file in the specified output directory and return the exported dict"""
     output_file = output_dir / "puckering_data.json"
     
     export_dict = {}
@@ -52,10 +56,14 @@ def save_results(results, output_dir):
             'conformation': puck['conformation']
         }
 
-    with open(output_file, 'w') as f:
-        json.dump(export_dict, f, indent=4)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(export_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(export_dict, f, indent=4)
 
     print(f"Full puckering data saved to: {output_file}")
+    return export_dict
 
 def main() -> bool:
     """Main function to run puckering analysis"""
@@ -63,6 +71,8 @@ def main() -> bool:
         print("Usage: python main.py <data_directory>")
         sys.exit(1)
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Setup paths
     data_path = SCRIPT_DIR / 'data'
     
@@ -81,11 +91,11 @@ def main() -> bool:
         
         # Process and save results
         #print_summary(results)
-        save_results(results, output_dir)
+        export_dict = save_results(results, output_dir)
         
-        # Generate plots
+        # Generate plots from the in-memory data
         plot_puckering_distribution(
-            json_path=str(output_dir / "puckering_data.json"),
+            data=export_dict,
             save_path=str(output_dir / "puckering_summary.pdf")
         )
         
@@ -1,34 +1,46 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as Gridspec
-import pandas as pd
 import json
 import os
+from pathlib import Path
+try:
+    import orjson  # Faster C-backed JSON decoder, used when available
+except ImportError:
+    orjson = None
 
-def plot_puckering_distribution(json_path: str, save_path: str = None):
+def plot_puckering_distribution(json_path: str = None, save_path: str = None, *, data: dict = None):
     """
     Plots puckering amplitude histogram and polar conformation plot
-    from a JSON file containing puckering data.
+    from puckering data, given in memory or as a JSON file.
 
     Parameters:
-        json_path (str): Path to JSON file with puckering data
+        json_path (str, optional): Path to JSON file with puckering data, used when data is not provided
         save_path (str, optional): If provided, saves the figure to this path
+        data (dict, optional, keyword-only): Puckering data as returned by save_results; takes precedence over json_path
     """
 
     # -----------------------------
-    # 1. Load and parse JSON
+    # 1. Load and parse JSON (only if the data is not already in memory)
     # -----------------------------
-    if not os.path.isfile(json_path):
-        print(f"JSON file not found: {json_path}")
-        return
+    if data is not None:
+        if not isinstance(data, dict):
+            raise TypeError(f"data must be a dict of puckering values, got {type(data).__name__}")
+        raw_data = data
+    else:
+        if json_path is None or not os.path.isfile(json_path):
+            print(f"JSON file not found: {json_path}")
+            return
 
-    with open(json_path, 'r') as f:
-        raw_data = json.load(f)
+        if orjson is not None:
+            raw_data = orjson.loads(Path(json_path).read_bytes())
+        else:
+            with open(json_path, 'r') as f:
+                raw_data = json.load(f)
 
-    info = {
-        key: pd.DataFrame([val])
-        for key, val in raw_data.items()
-    }
+    amp = np.fromiter((val['Amplitude'] for val in raw_data.values()), dtype=float)
+    theta_deg = np.fromiter((val['theta'] for val in raw_data.values()), dtype=float) % 180
+    phi_rad = np.deg2rad(np.fromiter((val['phi'] for val in raw_data.values()), dtype=float) % 360)
 
     # -----------------------------
     # 2. Plotting Setup
@@ -67,14 +79,9 @@ def plot_puckering_distribution(json_path: str, save_path: str = None):
     # -----------------------------
     # 3. Histogram and Polar Plot
     # -----------------------------
-    for key, df_polar in info.items():
-        ax[0].hist(df_polar['Amplitude'], bins=bins, alpha=0.7)
-
-        theta_deg = df_polar['theta'] % 180
-        phi_deg = df_polar['phi'] % 360
-        phi_rad = np.deg2rad(phi_deg)
-
-        ax[1].scatter(phi_rad, theta_deg, alpha=0.8, marker='.', s=250, edgecolors='black')
+    counts, edges = np.histogram(amp, bins=bins)
+    ax[0].bar(edges[:-1], counts, width=bin_width, align='edge', alpha=0.7)
+    ax[1].scatter(phi_rad, theta_deg, alpha=0.8, marker='.', s=250, edgecolors='black')
 
     ax[0].set_ylabel('Counts', color='black')
     ax[0].set_xlabel(r'Q / $\AA$', color='black')
@@ -89,18 +96,16 @@ def plot_puckering_distribution(json_path: str, save_path: str = None):
         phi_values = angles.get('phi', [0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330])
         style = marker_style[conformation]
 
-        for theta in theta_values:
-            for phi in phi_values:
-                theta_rad = np.deg2rad(phi)
-                r = theta
-                ax[1].plot(theta_rad, r, marker=style['marker'], markersize=5, alpha=0.1,
-                           color=style['color'], linestyle='None', label=conformation)
-                
-    #Legend if needed uncomment the following lines
+        # All (theta, phi) reference points of this conformation in a single scatter
+        ts, ps = np.meshgrid(theta_values, phi_values, indexing='ij')
+        theta_rads = np.deg2rad(ps.ravel())
+        rs = ts.ravel()
+        ax[1].scatter(theta_rads, rs, marker=style['marker'], s=25, alpha=0.1,
+                      color=style['color'], label=conformation)
+
+    #Legend if needed uncomment the following line
     #--------------------------------------------
-    #handles, labels = ax[1].get_legend_handles_labels()
-    #by_label = dict(zip(labels, handles))
-    #ax[1].legend(by_label.values(), by_label.keys(), loc='upper right', bbox_to_anchor=(1.15, 1.05))
+    #ax[1].legend(loc='upper right', bbox_to_anchor=(1.15, 1.05))
 
     ax[1].set_xticks(np.deg2rad([0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330]))
     ax[1].set_xticklabels(['0°', '30°', '60°', '90°', '120°', '150°', '180°', '210°', '240°', '270°', '300°', '330°'], fontsize=16, color='black')
@@ -1,8 +1,24 @@
+import io
+import logging
+import math
+import mmap
+from functools import lru_cache
 import numpy as np
-import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import os
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional: the vectorized numpy path is used instead of the kernel
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
+
 # Ring indices for DKP series
 ring_indices = {
     'cGlyGly': [0, 1, 2, 3, 4, 5],  
@@ -16,34 +32,92 @@ ring_indices = {
     'cPhePhe': [0, 5, 4, 3, 2, 1]
 }
 
-def parse_xyz_to_df(file_path):
+@lru_cache(maxsize=32)
+def _basis(N):
     """
-    Parse an XYZ file and return the number of atoms and a DataFrame with atomic coordinates.
-    :param file_path: str, the path to the XYZ file to be parsed.
-    :return: tuple, first element is an int representing the number of atoms,
-             and the second element is a pandas DataFrame with columns 'Atom', 'X', 'Y', 'Z'.
+    Build (once per ring size) the Fourier basis tables for a ring of size N.
+    Input: N (int)
+    Return: tuple (sin1, cos1, cosK, sinK, alt) of read-only numpy arrays: sin1, cos1 (shape (N,))
+            for the mean plane, cosK, sinK (shape (M, N)) for the puckering harmonics and alt = (-1)^j
     """
-    with open(file_path, 'r') as f:
-        lines = f.readlines()[2:]  # Skip the first two lines. 'lines' is a list of str.
+    j = np.arange(0, N)
+    if N % 2 == 0:
+        k = np.arange(2, N // 2)
+    else:
+        k = np.arange(2, (N - 1) // 2 + 1)
+    # One row per harmonic k, so all Fourier sums are a single matrix product
+    angles = (2 * np.pi / N) * np.outer(k, j)
+    tables = (np.sin(2 * np.pi * j / N), np.cos(2 * np.pi * j / N),
+              np.cos(angles), np.sin(angles), (-1.0)**j)
+    for table in tables:
+        table.setflags(write=False)  # Shared between calls through the cache
+    return tables
 
-        data = []  # This will be a list of lists, where each inner list represents an atom and its coordinates.
+# All rings in ring_indices are 6-membered
+_basis(6)
 
-        for line in lines:
-            parts = line.split()  # Splitting each line into parts. 'parts' is a list of str.
-            atom = parts[0]  # 'atom' is a str representing the atomic symbol.
-            x, y, z = map(float, parts[1:4])  # Converting strings to floats for the coordinates.
-            data.append([atom, x, y, z])  # Appending the atom and its coordinates to the 'data' list.
-    
-    # Creating a DataFrame from the 'data' list. Each row represents an atom and its coordinates.
-    df = pd.DataFrame(data, columns=['Atom', 'X', 'Y', 'Z'])
-    num_atoms = len(df)
-    return num_atoms, df
+# Reference conformations (Haasnoot, JACS 1992). A missing 'phi' matches any phi.
+conformations = {
+    'Chair (C)': {'theta': [0, 180]},
+    'Boat (B)': {'theta': [90], 'phi': [0, 60, 120, 180, 240, 300]},
+    'Twist-Boat (TB)': {'theta': [90], 'phi': [30, 90, 150, 210, 270, 330]},
+    'Half-Chair (HC)': {'theta': [30, 150]},
+    'Half-Boat (HB)': {'theta': [60, 120]}
+}
 
-def get_ring_coord(df, indices):
+@lru_cache(maxsize=None)
+def _conformation_table():
     """
-    Selects the atoms that compose the ring based on provided indices.
+    Flatten the reference conformations into parallel arrays (built once).
+    Return: tuple (labels, lat, lon) of read-only numpy arrays, lat/lon in radians;
+            a NaN longitude matches any phi
     """
-    return df.iloc[indices]
+    refs = [(conf, theta, phi) for conf, angles in conformations.items()
+            for theta in angles['theta'] for phi in angles.get('phi', [np.nan])]
+    labels = np.array([conf for conf, theta, phi in refs])
+    lat = np.deg2rad([90 - theta for conf, theta, phi in refs])
+    lon = np.deg2rad([phi for conf, theta, phi in refs])
+    for table in (labels, lat, lon):
+        table.setflags(write=False)
+    return labels, lat, lon
+
+@lru_cache(maxsize=None)
+def _conformation_grid():
+    """
+    Precompute the closest reference conformation for every 1° x 1° (θ, φ) cell (built once).
+    Return: read-only uint8 numpy array of shape (180, 360) with indices into the labels
+            of _conformation_table, evaluated at the cell centers
+    """
+    labels, lat2, lon2 = _conformation_table()
+    grid_theta, grid_phi = np.meshgrid(np.arange(180) + 0.5, np.arange(360) + 0.5, indexing='ij')
+    lat1 = np.deg2rad(90 - grid_theta)[..., None]
+    lon1 = np.deg2rad(grid_phi)[..., None]
+
+    # Same distance as the exact classifier, for all cells and reference points at once
+    dlon = np.where(np.isnan(lon2), 0.0, lon2 - lon1)
+    d2 = (lat2 - lat1)**2 + dlon**2
+    grid = d2.argmin(axis=-1).astype(np.uint8)
+    grid.setflags(write=False)
+    return grid
+
+# Build the classification grid at import so no ring pays for it
+_conformation_grid()
+
+def parse_xyz_to_df(file_path):
+    """
+    Parse an XYZ file and return the number of atoms and an array with atomic coordinates.
+    :param file_path: str, the path to the XYZ file to be parsed.
+    :return: tuple, first element is an int representing the number of atoms,
+             and the second element is a numpy array of shape (num_atoms, 3) with the X, Y, Z coordinates.
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        # Skip the atom count and comment lines, and read only the numeric columns
+        header_end = buf.find(b'\n', buf.find(b'\n') + 1)
+        if header_end < 0:
+            raise ValueError(f"{file_path} is missing the XYZ header lines")
+        coords = np.loadtxt(io.BytesIO(buf[header_end + 1:]), usecols=(1, 2, 3), dtype=np.float64, ndmin=2)
+    num_atoms = coords.shape[0]
+    return num_atoms, coords
 
 def translate(coordinates):
     """
@@ -59,9 +133,9 @@ def get_mean_plane(coordinates):
     Input: coordinates (numpy array)
     Return: R1, R2 (numpy arrays)
     """
-    N = coordinates.shape[0]  # Ring size
-    R1 = np.dot(np.sin(2 * np.pi * np.arange(0, N) / N), coordinates)
-    R2 = np.dot(np.cos(2 * np.pi * np.arange(0, N) / N), coordinates)
+    sin1, cos1, _, _, _ = _basis(coordinates.shape[0])
+    R1 = sin1 @ coordinates
+    R2 = cos1 @ coordinates
     return R1, R2
 
 def get_normal(coordinates):
@@ -72,13 +146,8 @@ def get_normal(coordinates):
     """
     R1, R2 = get_mean_plane(coordinates)
     cross_product = np.cross(R1, R2)
-    return cross_product / np.linalg.norm(cross_product)
-
-def fix_zero(x):
-    """
-    Fix the array at zero if the values are close enough to zero
-    """
-    return np.array([0.0]) if np.allclose(0, x, rtol=1e-06, atol=1e-08) else x
+    nrm = math.sqrt(cross_product[0]**2 + cross_product[1]**2 + cross_product[2]**2)
+    return cross_product / nrm
 
 def displacement(coordinates):
     """
@@ -98,23 +167,21 @@ def get_ring_pucker_coords(coordinates):
     N = coordinates.shape[0]  # Number of atoms in the ring
     z = displacement(coordinates)
     if 4 < N <= 20:
+        _, _, cosK, sinK, alt = _basis(N)
         if N % 2 == 0:
-            m = range(2, int(N / 2))
-            cos_component = [np.dot(z, np.cos(2 * np.pi * k * np.arange(0, N) / N)) for k in m]
-            sin_component = [np.dot(z, np.sin(2 * np.pi * k * np.arange(0, N) / N)) for k in m]
-            qcos = np.sqrt(2 / N) * np.array(cos_component)
-            qsin = -np.sqrt(2 / N) * np.array(sin_component)
+            qcos = np.sqrt(2 / N) * (cosK @ z)
+            qsin = -np.sqrt(2 / N) * (sinK @ z)
             q = np.sqrt(qsin**2 + qcos**2)
-            amplitude = np.append(q, (1 / np.sqrt(N)) * np.dot(z, np.cos(np.arange(0, N) * np.pi)).sum())
+            amplitude = np.append(q, (1 / np.sqrt(N)) * np.dot(z, alt))
             angle_rad = np.arctan2(qsin, qcos)
             angle_rad = np.where(angle_rad < 0, angle_rad + 2 * np.pi, angle_rad)
             angle_deg = np.degrees(angle_rad)
         else:
-            m = range(2, int((N - 1) / 2) + 1)
-            cos_component = [np.dot(z, np.cos(2 * np.pi * k * np.arange(0, N) / N)) for k in m]
-            sin_component = [np.dot(z, np.sin(2 * np.pi * k * np.arange(0, N) / N)) for k in m]
-            qcos = fix_zero(np.sqrt(2 / N) * np.array(cos_component))
-            qsin = fix_zero(-np.sqrt(2 / N) * np.array(sin_component))
+            qcos = np.sqrt(2 / N) * (cosK @ z)
+            qsin = -np.sqrt(2 / N) * (sinK @ z)
+            # Snap components that are numerically zero, so their phase angle is well defined
+            qcos = np.where(np.abs(qcos) < 1e-8, 0.0, qcos)
+            qsin = np.where(np.abs(qsin) < 1e-8, 0.0, qsin)
             amplitude = np.sqrt(qsin**2 + qcos**2)
             angle_rad = np.arctan2(qsin, qcos)
             angle_rad = np.where(angle_rad < 0, angle_rad + 2 * np.pi, angle_rad)
@@ -158,63 +225,121 @@ def get_spherical_polar_set_n6(amplitude, angle_deg):
     phi_deg = angle_deg[0]  
     
     return Q, theta_deg, phi_deg
+# Fourier tables for N=6: mean plane (k=1), q2 (k=2) and q3 ((-1)^j)
+_N6_SIN1, _N6_COS1, _N6_COSK, _N6_SINK, _N6_ALT = _basis(6)
+_N6_COS2 = _N6_COSK[0]
+_N6_SIN2 = _N6_SINK[0]
+
+@njit(cache=True)
+def _pucker_n6(ring_coords):
+    """
+    Closed-form Cremer-Pople parameters of a stack of 6-membered rings
+    Input: ring_coords (numpy array of shape (B, 6, 3), ring atom coordinates)
+    Output: numpy array of shape (B, 5) with q2, q3, phi_deg, Q, theta_deg per ring;
+            rows of degenerate rings (zero or non-finite normal) are NaN
+    """
+    B = ring_coords.shape[0]
+    out = np.empty((B, 5))
+    for b in range(B):
+        c = ring_coords[b]
+
+        # Center
+        cx = (c[0, 0] + c[1, 0] + c[2, 0] + c[3, 0] + c[4, 0] + c[5, 0]) / 6.0
+        cy = (c[0, 1] + c[1, 1] + c[2, 1] + c[3, 1] + c[4, 1] + c[5, 1]) / 6.0
+        cz = (c[0, 2] + c[1, 2] + c[2, 2] + c[3, 2] + c[4, 2] + c[5, 2]) / 6.0
+
+        # Mean plane vectors R1, R2
+        r1x = r1y = r1z = r2x = r2y = r2z = 0.0
+        for j in range(6):
+            x = c[j, 0] - cx
+            y = c[j, 1] - cy
+            z = c[j, 2] - cz
+            r1x += _N6_SIN1[j] * x
+            r1y += _N6_SIN1[j] * y
+            r1z += _N6_SIN1[j] * z
+            r2x += _N6_COS1[j] * x
+            r2y += _N6_COS1[j] * y
+            r2z += _N6_COS1[j] * z
+
+        # Unit normal n = R1 x R2 / |R1 x R2|
+        nx = r1y * r2z - r1z * r2y
+        ny = r1z * r2x - r1x * r2z
+        nz = r1x * r2y - r1y * r2x
+        nrm = math.sqrt(nx * nx + ny * ny + nz * nz)
+        if not (nrm > 0.0 and math.isfinite(nrm)):
+            out[b, :] = np.nan  # Degenerate ring: the mean plane is undefined
+            continue
+        nx /= nrm
+        ny /= nrm
+        nz /= nrm
+
+        # Displacements z_j and their Fourier components
+        qcos = qsin = q3 = 0.0
+        for j in range(6):
+            zj = (c[j, 0] - cx) * nx + (c[j, 1] - cy) * ny + (c[j, 2] - cz) * nz
+            qcos += _N6_COS2[j] * zj
+            qsin += _N6_SIN2[j] * zj
+            q3 += _N6_ALT[j] * zj
+        qcos *= math.sqrt(1.0 / 3.0)
+        qsin *= -math.sqrt(1.0 / 3.0)
+        q3 /= math.sqrt(6.0)
+
+        q2 = math.sqrt(qcos * qcos + qsin * qsin)
+        phi_rad = math.atan2(qsin, qcos)
+        if phi_rad < 0:
+            phi_rad += 2 * math.pi
+
+        Q = math.sqrt(q2 * q2 + q3 * q3)
+        if Q > 1e-10:
+            theta_deg = math.degrees(math.acos(min(max(q3 / Q, -1.0), 1.0)))
+        else:
+            theta_deg = 0.0  # Default to 0 for nearly-planar rings
+
+        out[b, 0] = q2
+        out[b, 1] = q3
+        out[b, 2] = math.degrees(phi_rad)
+        out[b, 3] = Q
+        out[b, 4] = theta_deg
+    return out
+
 def conformation_haversine(amplitude, theta_deg, phi_deg):
     """
     Classifies the ring conformation based on θ and φ values using haversine distance.
-    Returns the conformation as a string.
+    The nearest reference is looked up in a precomputed grid with 1° resolution.
+    Returns the conformation as a string, or None if θ or φ is not finite (degenerate ring).
     """
-    theta_deg = theta_deg % 180  # Normalize theta to [0, 180]
-    phi_deg = phi_deg % 360      # Normalize phi to [0, 360]
-    
-    conformations = {
-        'Chair (C)': {'theta': [0, 180]},
-        'Boat (B)': {'theta': [90], 'phi': [0, 60, 120, 180, 240, 300]},
-        'Twist-Boat (TB)': {'theta': [90], 'phi': [30, 90, 150, 210, 270, 330]},
-        'Half-Chair (HC)': {'theta': [30, 150]},
-        'Half-Boat (HB)': {'theta': [60, 120]}
-    }
-    
-    min_distance = float('inf')
-    assigned_conformation = None
-    
-    lat1 = np.deg2rad(90 - theta_deg)
-    lon1 = np.deg2rad(phi_deg)
-    point1 = np.array([[lat1, lon1]])
-    
-    for conformation, angles in conformations.items():
-        theta_refs = np.deg2rad(angles.get('theta', [theta_deg]))
-        phi_refs = np.deg2rad(angles.get('phi', [phi_deg]))
-        
-        for theta_ref in theta_refs:
-            for phi_ref in phi_refs:
-                lat2 = np.deg2rad(90 - np.degrees(theta_ref))
-                lon2 = np.deg2rad(np.degrees(phi_ref))
-                
-                point2 = np.array([[lat2, lon2]])
-                distance = np.linalg.norm(point1 - point2)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    assigned_conformation = conformation
-                
-    return assigned_conformation
-
-def get_pucker_values(df, system_name):
+    # A degenerate ring gives NaN angles, which have no grid cell (int() would raise)
+    if not (np.isfinite(theta_deg) and np.isfinite(phi_deg)):
+        return None
+
+    # Normalize theta to [0, 180) and phi to [0, 360), then take the 1° cell
+    i = int(theta_deg % 180) % 180
+    j = int(phi_deg % 360) % 360
+
+    labels, _, _ = _conformation_table()
+    return str(labels[_conformation_grid()[i, j]])
+
+def get_pucker_values(coords, system_name):
     """
     Computes puckering values for a given system.
-    :param df: DataFrame with atomic coordinates.
+    :param coords: numpy array of shape (num_atoms, 3) with atomic coordinates.
     :param system_name: str, name of the system being analyzed (e.g., 'cAlaAla').
     :return: puckering values and assigned conformation.
     """
-    # Identify the ring atoms using the pre-defined ring indices for the system
-    ring_atoms = get_ring_coord(df, ring_indices[system_name])
-    
-    # Translate ring atoms to center
-    coordinates = translate(ring_atoms[['X', 'Y', 'Z']].values)
-    
-    # Get puckering amplitude, angles, and conformation
-    amplitude, angle_deg, angle_rad = get_ring_pucker_coords(coordinates)
-    Q, theta_deg, phi_deg = get_spherical_polar_set_n6(amplitude, angle_deg)
+    ring_atoms = coords[ring_indices[system_name]]
+
+    if len(ring_atoms) == 6 and _HAVE_NUMBA:
+        # Specialized compiled closed-form path for 6-membered rings
+        q2, q3, phi_deg, Q, theta_deg = _pucker_n6(np.ascontiguousarray(ring_atoms[None], dtype=np.float64))[0]
+        amplitude = np.array([q2, q3])
+        angle_deg = np.array([phi_deg])
+    else:
+        # Translate ring atoms to center
+        coordinates = translate(ring_atoms)
+
+        # Get puckering amplitude, angles, and conformation
+        amplitude, angle_deg, angle_rad = get_ring_pucker_coords(coordinates)
+        Q, theta_deg, phi_deg = get_spherical_polar_set_n6(amplitude, angle_deg)
     
     conformation = conformation_haversine(amplitude, theta_deg, phi_deg)
     
@@ -227,41 +352,175 @@ def get_pucker_values(df, system_name):
         'conformation': conformation
     }
 
+def _batch_ring_pucker_coords(ring_coords):
+    """
+    Vectorized get_ring_pucker_coords for a stack of rings of any size.
+    Input: ring_coords (numpy array of shape (B, N, 3))
+    Return: amplitude, angle_deg (numpy arrays with one row per ring) and valid
+            (boolean array, False for degenerate rings whose rows are meaningless)
+    """
+    B, N, _ = ring_coords.shape
+    sin1, cos1, cosK, sinK, alt = _basis(N)
+
+    # Translate every ring to its center
+    centered = ring_coords - ring_coords.mean(axis=1, keepdims=True)
+
+    # Mean plane, unit normal and displacement (z) for all rings at once
+    R1 = np.einsum('n,bnj->bj', sin1, centered)
+    R2 = np.einsum('n,bnj->bj', cos1, centered)
+    n = np.cross(R1, R2)
+    n2 = np.einsum('bi,bi->b', n, n)
+    # A zero or non-finite normal means a degenerate ring: keep it out of the other rings' results
+    valid = np.isfinite(n2) & (n2 > 0)
+    n[valid] /= np.sqrt(n2[valid])[:, None]
+    n[~valid] = 0.0
+    z = np.einsum('bnj,bj->bn', centered, n)
+
+    # Puckering harmonics, shape (B, M)
+    qcos = np.sqrt(2 / N) * (z @ cosK.T)
+    qsin = -np.sqrt(2 / N) * (z @ sinK.T)
+    if N % 2 == 0:
+        q = np.sqrt(qsin**2 + qcos**2)
+        amplitude = np.column_stack([q, (1 / np.sqrt(N)) * (z @ alt)])
+    else:
+        # Snap components that are numerically zero, so their phase angle is well defined
+        qcos[np.abs(qcos) < 1e-8] = 0.0
+        qsin[np.abs(qsin) < 1e-8] = 0.0
+        amplitude = np.sqrt(qsin**2 + qcos**2)
+    angle_rad = np.arctan2(qsin, qcos)
+    angle_rad = np.where(angle_rad < 0, angle_rad + 2 * np.pi, angle_rad)
+    angle_deg = np.degrees(angle_rad)
+    return amplitude, angle_deg, valid
+
+def get_batch_pucker_values(ring_coords):
+    """
+    Computes puckering values for a stack of rings of the same size in one pass.
+    :param ring_coords: numpy array of shape (B, N, 3) with the ring atom coordinates of B structures.
+    :return: list of B dicts with the same keys as returned by get_pucker_values,
+             or None for rings whose mean plane is undefined (degenerate geometry).
+    """
+    B, N, _ = ring_coords.shape
+
+    if N == 6 and _HAVE_NUMBA:
+        # Specialized compiled closed-form kernel for 6-membered rings (slower than numpy if not compiled)
+        q2, q3, phi_deg, Q, theta_deg = _pucker_n6(np.ascontiguousarray(ring_coords, dtype=np.float64)).T
+        amplitude = np.column_stack([q2, q3])
+        angle_deg = phi_deg[:, None]
+        valid = np.isfinite(Q)
+    else:
+        amplitude, angle_deg, valid = _batch_ring_pucker_coords(ring_coords)
+        spherical = [get_spherical_polar_set_n6(amp, ang) for amp, ang in zip(amplitude, angle_deg)]
+        Q, theta_deg, phi_deg = (np.array(values, dtype=np.float64) for values in zip(*spherical))
+
+    # Map the stacked results back to one record per ring
+    puckering_values = []
+    for b in range(B):
+        if not valid[b]:
+            puckering_values.append(None)
+            continue
+        puckering_values.append({
+            'amplitude': amplitude[b],
+            'angle_deg': angle_deg[b],
+            'Q': Q[b],
+            'theta_deg': theta_deg[b],
+            'phi_deg': phi_deg[b],
+            'conformation': conformation_haversine(amplitude[b], theta_deg[b], phi_deg[b])
+        })
+    return puckering_values
+
+def _process_one(task):
+    """
+    Parse one XYZ file and extract its ring atoms. Runs in a worker process.
+    :param task: tuple (xyz_file, system_name, chirality).
+    :return: dict with 'xyz_file', 'system_name', 'chirality' and 'ring_coords', or None if the file could not be processed.
+    """
+    xyz_file, system_name, chirality = task
+    try:
+        num_atoms, coords = parse_xyz_to_df(xyz_file)
+        ring_coords = coords[ring_indices[system_name]]
+    except Exception as e:
+        logger.debug(f"Error processing {xyz_file.name}: {e}")
+        return None
+
+    return {
+        'xyz_file': xyz_file,
+        'system_name': system_name,
+        'chirality': chirality,
+        'ring_coords': ring_coords
+    }
+
+# Files per worker task: contiguous slices of one directory, so large directories still spread across workers
+_CHUNK_SIZE = 64
+
+def _process_chunk(tasks):
+    """
+    Process a contiguous chunk of XYZ files from one directory, in order, within a single worker.
+    :param tasks: list of (xyz_file, system_name, chirality) tuples sharing the same parent directory.
+    :return: list with the _process_one result of each task.
+    """
+    return [_process_one(task) for task in tasks]
+
 def analyze_system(system_folder):
-    results = []
+    by_dir = {}  # Tasks grouped by parent directory
+    counts = {}  # Per-chirality file counters, reported once at the end
 
     for chirality in ['SS', 'SR']:
         chirality_folder = Path(system_folder) / chirality
-        print(f"Looking in folder: {chirality_folder}")
+        logger.debug(f"Looking in folder: {chirality_folder}")
 
         if chirality_folder.exists():
             # Now recursively search for .xyz files in subdirectories
-            xyz_files = list(chirality_folder.rglob('*.xyz'))
-            print(f"  Found {len(xyz_files)} .xyz files")
+            # Sorted by directory so that files sharing a folder are read back to back
+            xyz_files = sorted(chirality_folder.rglob('*.xyz'), key=lambda p: (p.parent, p.name))
+            logger.debug(f"  Found {len(xyz_files)} .xyz files")
+            counts[chirality] = {'found': len(xyz_files), 'skipped': 0, 'errors': 0}
 
             for xyz_file in xyz_files:
                 system_name = xyz_file.parent.name  # Get system name from subfolder name
-                file_stem = xyz_file.stem
 
                 if system_name not in ring_indices:
-                    print(f"Skipping {xyz_file.name}: system name '{system_name}' not in ring_indices")
+                    logger.debug(f"Skipping {xyz_file.name}: system name '{system_name}' not in ring_indices")
+                    counts[chirality]['skipped'] += 1
                     continue
 
-                try:
-                    num_atoms, df = parse_xyz_to_df(xyz_file)
-                    puckering_values = get_pucker_values(df, system_name)
-                except Exception as e:
-                    print(f"Error processing {xyz_file.name}: {e}")
-                    continue
-
-                result = {
-                    'system_name': system_name,
-                    'chirality': chirality,
-                    'puckering_values': puckering_values
-                }
-                results.append(result)
+                by_dir.setdefault(xyz_file.parent, []).append((xyz_file, system_name, chirality))
         else:
-            print(f"Folder does not exist: {chirality_folder}")
-    
-    return results
+            logger.info(f"Folder does not exist: {chirality_folder}")
+
+    # Split every directory's sorted file list into contiguous chunks
+    chunks = [tasks[i:i + _CHUNK_SIZE] for tasks in by_dir.values() for i in range(0, len(tasks), _CHUNK_SIZE)]
+
+    results = []
+    if chunks:
+        # Files are independent, so parse them across all cores, one chunk per worker task
+        with ProcessPoolExecutor() as ex:
+            for tasks, chunk_results in zip(chunks, ex.map(_process_chunk, chunks)):
+                for (xyz_file, system_name, chirality), result in zip(tasks, chunk_results):
+                    if result is None:
+                        counts[chirality]['errors'] += 1
+                    else:
+                        results.append(result)
+
+    # Compute the puckering in one batch per ring size, since only same-size rings can be stacked
+    by_size = {}
+    for result in results:
+        by_size.setdefault(len(result['ring_coords']), []).append(result)
+    for group in by_size.values():
+        ring_coords = np.stack([result.pop('ring_coords') for result in group])
+        for result, puckering_values in zip(group, get_batch_pucker_values(ring_coords)):
+            result['puckering_values'] = puckering_values
+
+    parsed, results = results, []
+    for result in parsed:
+        xyz_file = result.pop('xyz_file')
+        if result['puckering_values'] is None:
+            logger.debug(f"Error processing {xyz_file.name}: degenerate ring geometry")
+            counts[result['chirality']]['errors'] += 1
+            continue
+        results.append(result)
 
+    for chirality, count in counts.items():
+        logger.info(f"{chirality}: found {count['found']} .xyz files, "
+                    f"skipped {count['skipped']}, errors {count['errors']}")
+
+    return results